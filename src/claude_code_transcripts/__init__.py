@@ -184,29 +184,72 @@ def _get_jsonl_summary(filepath, max_length=200):
     return "(no summary)"
 
 
+def _iter_jsonl(root):
+    """Recursively yield an os.DirEntry for every .jsonl file under root.
+
+    Uses os.scandir so directory entries are not wrapped in Path objects;
+    entry.stat() is only issued (and then cached) for callers that need it.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                # Like Path.glob("**"), do not recurse into symlinked folders
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".jsonl"):
+                    yield entry
+
+
 def find_local_sessions(folder, limit=10):
     """Find recent JSONL session files in the given folder.
 
     Returns a list of (Path, summary) tuples sorted by modification time.
     Excludes agent files and warmup/empty sessions.
     """
+    return [
+        (f, summary) for f, summary, _ in _find_local_session_entries(folder, limit)
+    ]
+
+
+def _find_local_session_entries(folder, limit=10):
+    """Like find_local_sessions, but returns (Path, summary, stat) tuples.
+
+    The stat result is the one already fetched while walking the folder.
+    """
     folder = Path(folder)
     if not folder.exists():
         return []
 
-    results = []
-    for f in folder.glob("**/*.jsonl"):
-        if f.name.startswith("agent-"):
+    candidates = []
+    for entry in _iter_jsonl(folder):
+        if entry.name.startswith("agent-"):
+            continue
+        try:
+            stat = entry.stat()
+        except OSError:
+            # Dangling symlink, or the file was removed during the walk
             continue
+        candidates.append((stat, entry.path))
+    # Sort by modification time, most recent first, so summaries only need
+    # to be read until enough sessions have been found
+    candidates.sort(key=lambda x: x[0].st_mtime, reverse=True)
+
+    results = []
+    for stat, path in candidates:
+        if len(results) >= limit:
+            break
+        f = Path(path)
         summary = get_session_summary(f)
         # Skip boring/empty sessions
         if summary.lower() == "warmup" or summary == "(no summary)":
             continue
-        results.append((f, summary))
-
-    # Sort by modification time, most recent first
-    results.sort(key=lambda x: x[0].stat().st_mtime, reverse=True)
-    return results[:limit]
+        results.append((f, summary, stat))
+    return results
 
 
 def get_project_display_name(folder_name):
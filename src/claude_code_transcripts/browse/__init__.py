@@ -5,6 +5,8 @@ This module provides the `browse` command for launching an interactive
 web browser to view Claude Code sessions.
 """
 
+import hashlib
+import shutil
 import subprocess
 import webbrowser
 from pathlib import Path
@@ -14,6 +16,47 @@ import uvicorn
 
 from .api import create_app
 
+_FRONTEND_DIR = Path(__file__).parent / "frontend"
+
+
+def _run_streaming(cmd: list[str], cwd: Path) -> bool:
+    """
+    Run a command, echoing its combined stdout/stderr line by line.
+
+    Output is passed straight through rather than buffered in memory.
+    Returns True if the command exited successfully.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+    except OSError as e:
+        click.echo(f"Error running {' '.join(cmd)}: {e}")
+        return False
+    with proc.stdout:
+        for line in proc.stdout:
+            click.echo(line.rstrip())
+    returncode = proc.wait()
+    if returncode != 0:
+        click.echo(f"Error running {' '.join(cmd)}: exit code {returncode}")
+        return False
+    return True
+
+
+def _lockfile_hash(frontend_dir: Path, pm: str) -> str | None:
+    """Return a BLAKE2b digest of the package manager's lockfile, if any."""
+    names = ["bun.lock", "bun.lockb"] if pm == "bun" else ["package-lock.json"]
+    for name in names:
+        lockfile = frontend_dir / name
+        if lockfile.exists():
+            return f"{name}:{hashlib.blake2b(lockfile.read_bytes()).hexdigest()}"
+    return None
+
 
 def check_and_build_frontend():
     """
@@ -21,8 +64,9 @@ def check_and_build_frontend():
 
     Returns True if frontend is ready, False otherwise.
     """
-    frontend_dist = Path(__file__).parent / "frontend" / "dist"
-    frontend_src = Path(__file__).parent / "frontend" / "src"
+    frontend_dir = _FRONTEND_DIR
+    frontend_dist = frontend_dir / "dist"
+    frontend_src = frontend_dir / "src"
 
     # Check if already built
     if frontend_dist.exists() and (frontend_dist / "index.html").exists():
@@ -36,60 +80,39 @@ def check_and_build_frontend():
 
     click.echo("Building frontend...")
 
-    # Check if bun is available
-    pm = None
-    try:
-        subprocess.run(
-            ["bun", "--version"],
-            capture_output=True,
-            check=True,
-        )
-        pm = "bun"
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        pass
-
-    # Fallback to npm if bun not found
-    if pm is None:
-        try:
-            subprocess.run(
-                ["npm", "--version"],
-                capture_output=True,
-                check=True,
-            )
-            pm = "npm"
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            click.echo("Error: bun (or npm) is not installed.")
-            click.echo("Please install bun to build the frontend.")
-            return False
-
-    frontend_dir = Path(__file__).parent / "frontend"
-
-    # Install dependencies
-    try:
-        result = subprocess.run(
-            [pm, "install"],
-            cwd=frontend_dir,
-            capture_output=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        click.echo(f"Error running {pm} install: {e}")
-        if result.stderr:
-            click.echo(f"stderr: {result.stderr.decode()}")
+    # Prefer bun, falling back to npm (a PATH lookup, no process spawned).
+    # The resolved path is used to run it, so Windows .cmd shims work too.
+    for name in ("bun", "npm"):
+        pm_path = shutil.which(name)
+        if pm_path:
+            pm = name
+            break
+    else:
+        click.echo("Error: bun (or npm) is not installed.")
+        click.echo("Please install bun to build the frontend.")
         return False
 
+    # Install dependencies, unless the lockfile is unchanged since last time
+    lock_hash = _lockfile_hash(frontend_dir, pm)
+    stamp = frontend_dir / ".install_stamp"
+    installed = (
+        lock_hash is not None
+        and (frontend_dir / "node_modules").exists()
+        and stamp.exists()
+        and stamp.read_text().strip() == lock_hash
+    )
+    if installed:
+        click.echo(f"Dependencies up to date, skipping {pm} install.")
+    else:
+        if not _run_streaming([pm_path, "install"], frontend_dir):
+            return False
+        # Install may rewrite the lockfile, so stamp what is on disk now
+        lock_hash = _lockfile_hash(frontend_dir, pm)
+        if lock_hash is not None:
+            stamp.write_text(lock_hash)
+
     # Build
-    try:
-        result = subprocess.run(
-            [pm, "run", "build"],
-            cwd=frontend_dir,
-            capture_output=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        click.echo(f"Error running {pm} run build: {e}")
-        if result.stderr:
-            click.echo(f"stderr: {result.stderr.decode()}")
+    if not _run_streaming([pm_path, "run", "build"], frontend_dir):
         return False
 
     click.echo("Frontend built successfully.")
@@ -129,4 +152,12 @@ def run_browser(port: int, open_browser: bool = True):
     click.echo(f"Starting Claude Session Browser at {url}")
     click.echo("Press Ctrl+C to stop.")
 
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="info",
+        loop="auto",
+        http="auto",
+        ws="none",
+    )
@@ -4,47 +4,104 @@ Starlette API server for Claude Session Browser.
 Provides REST API endpoints for browsing local Claude Code sessions.
 """
 
+import asyncio
 import json
+import os
+import re
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
+import msgspec
+from markupsafe import escape
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, HTMLResponse, FileResponse
+from starlette.responses import (
+    JSONResponse,
+    HTMLResponse,
+    FileResponse,
+    Response,
+    StreamingResponse,
+)
 from starlette.routing import Route, Mount
 from starlette.staticfiles import StaticFiles
 from starlette.middleware.cors import CORSMiddleware
 
-# Import functions from parent module
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from claude_code_transcripts import (
-    find_local_sessions,
+from .. import (
+    _iter_jsonl,
+    _find_local_session_entries,
     parse_session_file,
     get_session_summary,
     get_project_display_name,
 )
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with msgspec instead of the stdlib json module."""
+
+    def render(self, content) -> bytes:
+        return msgspec.json.encode(content)
+
+
+# Vite emits content-hashed asset names like "index-BxK3_a9Z.js"
+_HASHED_ASSET_RE = re.compile(r"-[A-Za-z0-9_-]{8}\.(?:js|css|woff2?|png|svg)$")
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles that marks content-hashed assets as cacheable forever."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if _HASHED_ASSET_RE.search(os.path.basename(full_path)):
+            response.headers["cache-control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Favorite sessions storage
 _FAVORITES_FILE = Path.home() / ".claude" / "favorites.json"
 
+# (path, st_mtime_ns, st_size, favorites) from the last read of the file
+_FAV_CACHE: tuple[Path, int, int, frozenset[str]] | None = None
+
 
 def _load_favorites() -> set[str]:
-    """Load favorite session IDs from storage."""
-    if _FAVORITES_FILE.exists():
-        try:
-            data = json.loads(_FAVORITES_FILE.read_text())
-            return set(data.get("favorites", []))
-        except Exception:
-            pass
-    return set()
+    """Load favorite session IDs from storage.
+
+    The parsed file is cached in memory until its mtime or size changes.
+    """
+    global _FAV_CACHE
+
+    try:
+        stat = _FAVORITES_FILE.stat()
+    except OSError:
+        return set()
+
+    key = (_FAVORITES_FILE, stat.st_mtime_ns, stat.st_size)
+    if _FAV_CACHE is not None and _FAV_CACHE[:3] == key:
+        return set(_FAV_CACHE[3])
+
+    try:
+        data = json.loads(_FAVORITES_FILE.read_text())
+        favorites = frozenset(data.get("favorites", []))
+    except Exception:
+        return set()
+    _FAV_CACHE = (*key, favorites)
+    return set(favorites)
 
 
 def _save_favorites(favorites: set[str]) -> None:
-    """Save favorite session IDs to storage."""
+    """Save favorite session IDs to storage.
+
+    Writes to a temporary file and renames it over the original, so a crash
+    mid-write never leaves a truncated favorites file behind.
+    """
+    global _FAV_CACHE
+
     _FAVORITES_FILE.parent.mkdir(parents=True, exist_ok=True)
-    _FAVORITES_FILE.write_text(json.dumps({"favorites": list(favorites)}, indent=2))
+    payload = msgspec.json.encode({"favorites": sorted(favorites)})
+    tmp = _FAVORITES_FILE.with_name(_FAVORITES_FILE.name + ".tmp")
+    tmp.write_bytes(msgspec.json.format(payload, indent=2))
+    os.replace(tmp, _FAVORITES_FILE)
+    _FAV_CACHE = None
 
 
 def _is_favorite(session_id: str) -> bool:
@@ -65,26 +122,78 @@ def _toggle_favorite(session_id: str) -> bool:
         return True
 
 
-def _find_session_file(session_id: str) -> Path | None:
+# Session ID -> file path index, rebuilt when the projects folder changes
+_SESSION_INDEX: dict[str, Path] = {}
+_INDEX_ROOT: Path | None = None
+_INDEX_MTIME: float = 0
+
+
+def _build_session_index(projects_folder: Path) -> dict[str, Path]:
+    """Walk the projects folder once and map session IDs to file paths."""
+    index = {}
+    for entry in _iter_jsonl(projects_folder):
+        # Only the winning entry for each ID gets wrapped in a Path
+        session_id = entry.name[:-6]
+        if session_id not in index:
+            index[session_id] = Path(entry.path)
+    return index
+
+
+def _find_session_file(session_id: str, project: str | None = None) -> Path | None:
     """
     Find a session file by its ID.
 
+    If the encoded project folder name is given, the path is built directly.
+    Otherwise (or if that file does not exist) lookups are served from an
+    in-memory index which is rebuilt whenever the projects folder mtime
+    changes or the ID is not found.
+
     Args:
         session_id: The session ID (filename without extension)
+        project: Optional project folder name the session lives in
 
     Returns:
         Path to the session file, or None if not found
     """
+    global _SESSION_INDEX, _INDEX_ROOT, _INDEX_MTIME
+
     projects_folder = Path.home() / ".claude" / "projects"
 
-    if not projects_folder.exists():
+    # Only accept a plain folder name, never a path that could escape
+    if project and project not in (".", "..") and Path(project).name == project:
+        filepath = projects_folder / project / f"{session_id}.jsonl"
+        if filepath.is_file():
+            return filepath
+
+    try:
+        mtime = projects_folder.stat().st_mtime
+    except OSError:
         return None
 
-    for filepath in projects_folder.glob("**/*.jsonl"):
-        if filepath.stem == session_id:
+    if _INDEX_ROOT == projects_folder and _INDEX_MTIME == mtime:
+        filepath = _SESSION_INDEX.get(session_id)
+        if filepath is not None and filepath.exists():
             return filepath
 
-    return None
+    # New sessions inside an existing project do not change the top-level
+    # mtime, so a miss always triggers a rebuild.
+    _SESSION_INDEX = _build_session_index(projects_folder)
+    _INDEX_ROOT = projects_folder
+    _INDEX_MTIME = mtime
+
+    return _SESSION_INDEX.get(session_id)
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a session file, memoised on its path, mtime and size."""
+    return parse_session_file(Path(path_str))
+
+
+def _parse_session(session_file: Path) -> dict:
+    """Parse a session file, reusing the cached result if it is unchanged."""
+    stat = session_file.stat()
+    return _parse_cached(str(session_file), stat.st_mtime_ns, stat.st_size)
 
 
 def get_session_id(filepath: Path) -> str:
@@ -92,9 +201,19 @@ def get_session_id(filepath: Path) -> str:
     return filepath.stem
 
 
-def format_session_info(filepath: Path, summary: str) -> dict:
-    """Format session info for API response."""
-    stat = filepath.stat()
+def format_session_info(
+    filepath: Path,
+    summary: str,
+    stat: os.stat_result | None = None,
+    favorites: set[str] | None = None,
+) -> dict:
+    """Format session info for API response.
+
+    Pass a pre-fetched stat result and favorites set to avoid blocking
+    filesystem calls for every session.
+    """
+    if stat is None:
+        stat = filepath.stat()
     project_name = get_project_display_name(filepath.parent.parent.name)
     session_id = get_session_id(filepath)
 
@@ -104,8 +223,11 @@ def format_session_info(filepath: Path, summary: str) -> dict:
         "mtime": int(stat.st_mtime),
         "size": stat.st_size,
         "project": project_name,
+        "projectDir": filepath.parent.name,
         "filePath": str(filepath),
-        "isFavorite": _is_favorite(session_id),
+        "isFavorite": (
+            _is_favorite(session_id) if favorites is None else session_id in favorites
+        ),
     }
 
 
@@ -121,12 +243,77 @@ async def get_sessions(request):
     projects_folder = Path.home() / ".claude" / "projects"
 
     if not projects_folder.exists():
-        return JSONResponse({"sessions": []}, status_code=200)
+        return FastJSONResponse({"sessions": []}, status_code=200)
+
+    results = await asyncio.to_thread(
+        _find_local_session_entries, projects_folder, limit
+    )
+    favorites = _load_favorites()
+    sessions = [
+        format_session_info(fp, summary, stat, favorites)
+        for fp, summary, stat in results
+    ]
+
+    return FastJSONResponse({"sessions": sessions})
 
-    results = find_local_sessions(projects_folder, limit=limit)
-    sessions = [format_session_info(fp, summary) for fp, summary in results]
 
-    return JSONResponse({"sessions": sessions})
+# Constant fragments of the session HTML view, encoded once at import time
+_HTML_HEAD = b"<html><head><title>Session</title></head><body>"
+_HTML_ENTRY_START = b"<div class='entry "
+_HTML_ENTRY_MID = b"'><pre>"
+_HTML_ENTRY_END = b"</pre></div>"
+_HTML_TAIL = b"</body></html>"
+_HTML_ENTRY_OVERHEAD = len(_HTML_ENTRY_START + _HTML_ENTRY_MID + _HTML_ENTRY_END)
+
+
+# Streamed chunks are batched to about this size, since each chunk from a
+# sync iterator costs a worker-thread round trip plus an ASGI send
+_HTML_CHUNK_SIZE = 64 * 1024
+
+
+def _entry_text(entry) -> tuple[str, str]:
+    """Return (entry_type, text) for a log entry, tolerating malformed data."""
+    entry_type = entry.get("type")
+    if not isinstance(entry_type, str):
+        entry_type = "unknown"
+
+    message = entry.get("message") or {}
+    content = message.get("content", "") if isinstance(message, dict) else ""
+
+    if isinstance(content, list):
+        text = " ".join(
+            block["text"]
+            for block in content
+            if isinstance(block, dict)
+            and block.get("type") == "text"
+            and isinstance(block.get("text"), str)
+        )
+    elif isinstance(content, str):
+        text = content
+    else:
+        text = ""
+    return entry_type, text
+
+
+def _iter_session_html(loglines: list) -> Iterator[bytes]:
+    """Yield the simple session HTML page as bytes, in ~64 KB batches."""
+    parts = [_HTML_HEAD]
+    size = len(_HTML_HEAD)
+    for entry in loglines:
+        if not isinstance(entry, dict):
+            continue
+        entry_type, text = _entry_text(entry)
+        entry_type = escape(entry_type).encode()
+        text = escape(text).encode()
+        parts += (_HTML_ENTRY_START, entry_type, _HTML_ENTRY_MID, text, _HTML_ENTRY_END)
+        size += len(entry_type) + len(text) + _HTML_ENTRY_OVERHEAD
+        if size >= _HTML_CHUNK_SIZE:
+            yield b"".join(parts)
+            parts = []
+            size = 0
+
+    parts.append(_HTML_TAIL)
+    yield b"".join(parts)
 
 
 async def get_session_html(request):
@@ -134,9 +321,11 @@ async def get_session_html(request):
     GET /api/sessions/{session_id}/html
 
     Returns rendered HTML for the session (reusing existing templates).
+    Query params:
+        project: encoded project folder name, skips the session file search
     """
     session_id = request.path_params["session_id"]
-    session_file = _find_session_file(session_id)
+    session_file = _find_session_file(session_id, request.query_params.get("project"))
 
     if session_file is None:
         return HTMLResponse(
@@ -146,32 +335,15 @@ async def get_session_html(request):
     # For now, return a simple HTML response
     # TODO: Could reuse generate_html() logic for full rendering
     try:
-        data = parse_session_file(session_file)
-        loglines = data.get("loglines", [])
-
-        html_parts = ["<html><head><title>Session</title></head><body>"]
-        for entry in loglines:
-            entry_type = entry.get("type", "unknown")
-            message = entry.get("message", {})
-            content = message.get("content", "")
-
-            if isinstance(content, list):
-                text = " ".join(
-                    block.get("text", "")
-                    for block in content
-                    if isinstance(block, dict) and block.get("type") == "text"
-                )
-            else:
-                text = content
-
-            html_parts.append(
-                f"<div class='entry {entry_type}'><pre>{text}</pre></div>"
-            )
-
-        html_parts.append("</body></html>")
-        return HTMLResponse("".join(html_parts))
+        data = await asyncio.to_thread(_parse_session, session_file)
     except Exception as e:
-        return HTMLResponse(f"<html><body>Error: {e}</body></html>", status_code=500)
+        return HTMLResponse(
+            f"<html><body>Error: {escape(e)}</body></html>", status_code=500
+        )
+
+    return StreamingResponse(
+        _iter_session_html(data.get("loglines", [])), media_type="text/html"
+    )
 
 
 async def session_detail_or_delete(request):
@@ -179,38 +351,41 @@ async def session_detail_or_delete(request):
     GET/DELETE /api/sessions/{session_id}
 
     Get session details (GET) or delete a session (DELETE).
+    Query params:
+        project: encoded project folder name, skips the session file search
     """
     session_id = request.path_params["session_id"]
-    session_file = _find_session_file(session_id)
+    session_file = _find_session_file(session_id, request.query_params.get("project"))
 
     if session_file is None:
-        return JSONResponse({"error": "Session not found"}, status_code=404)
+        return FastJSONResponse({"error": "Session not found"}, status_code=404)
 
     if request.method == "DELETE":
         try:
-            session_file.unlink()
+            await asyncio.to_thread(session_file.unlink)
+            _parse_cached.cache_clear()
             # Also remove from favorites if present
             favorites = _load_favorites()
             if session_id in favorites:
                 favorites.remove(session_id)
                 _save_favorites(favorites)
 
-            return JSONResponse({"success": True})
+            return FastJSONResponse({"success": True})
         except Exception as e:
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return FastJSONResponse({"error": str(e)}, status_code=500)
     else:  # GET
         try:
-            data = parse_session_file(session_file)
-            summary = get_session_summary(session_file)
+            data = await asyncio.to_thread(_parse_session, session_file)
+            summary = await asyncio.to_thread(get_session_summary, session_file)
 
-            return JSONResponse(
+            return FastJSONResponse(
                 {
                     "loglines": data.get("loglines", []),
                     "summary": summary,
                 }
             )
         except Exception as e:
-            return JSONResponse({"error": str(e)}, status_code=500)
+            return FastJSONResponse({"error": str(e)}, status_code=500)
 
 
 async def toggle_favorite(request):
@@ -218,38 +393,53 @@ async def toggle_favorite(request):
     POST /api/sessions/{session_id}/favorite
 
     Toggle favorite status of a session.
+    Query params:
+        project: encoded project folder name, skips the session file search
     """
     session_id = request.path_params["session_id"]
-    session_file = _find_session_file(session_id)
+    session_file = _find_session_file(session_id, request.query_params.get("project"))
 
     if session_file is None:
-        return JSONResponse({"error": "Session not found"}, status_code=404)
+        return FastJSONResponse({"error": "Session not found"}, status_code=404)
 
     try:
         is_favorite = _toggle_favorite(session_id)
-        return JSONResponse({"isFavorite": is_favorite})
+        return FastJSONResponse({"isFavorite": is_favorite})
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return FastJSONResponse({"error": str(e)}, status_code=500)
 
 
-def create_app(*, dev_mode: bool = False) -> Starlette:
+def create_app(
+    *, dev_mode: bool = False, frontend_dist: Path | None = None
+) -> Starlette:
     """
     Create and configure the Starlette application.
 
     Args:
         dev_mode: If True, serve frontend from Vite dev server proxy.
                   If False, serve static files from dist folder.
+        frontend_dist: Built frontend folder (defaults to frontend/dist
+                  next to this module).
     """
     # Determine frontend static files path
-    frontend_dist = Path(__file__).parent / "frontend" / "dist"
+    if frontend_dist is None:
+        frontend_dist = Path(__file__).parent / "frontend" / "dist"
     frontend_assets = frontend_dist / "assets"
 
+    api_routes = [
+        Route("/sessions", get_sessions, methods=["GET"]),
+        Route(
+            "/sessions/{session_id}",
+            session_detail_or_delete,
+            methods=["GET", "DELETE"],
+        ),
+        Route("/sessions/{session_id}/favorite", toggle_favorite, methods=["POST"]),
+        Route("/sessions/{session_id}/html", get_session_html, methods=["GET"]),
+    ]
+
     routes = [
-        # API routes (must be first)
-        Route("/api/sessions", get_sessions, methods=["GET"]),
-        Route("/api/sessions/{session_id}", session_detail_or_delete, methods=["GET", "DELETE"]),
-        Route("/api/sessions/{session_id}/favorite", toggle_favorite, methods=["POST"]),
-        Route("/api/sessions/{session_id}/html", get_session_html, methods=["GET"]),
+        # API routes (must be first), matched by prefix before the inner router
+        Mount("/api", routes=api_routes),
     ]
 
     # Add frontend static files
@@ -259,30 +449,53 @@ def create_app(*, dev_mode: bool = False) -> Starlette:
             routes.append(
                 Mount(
                     "/assets",
-                    app=StaticFiles(directory=str(frontend_assets)),
+                    app=ImmutableStaticFiles(directory=str(frontend_assets)),
                     name="assets",
                 )
             )
 
-        # Catch-all route for SPA (must be last)
-        async def serve_index(request):
-            return FileResponse(frontend_dist / "index.html")
+        index_file = frontend_dist / "index.html"
+        if dev_mode or not index_file.is_file():
+            # Re-read on every request so rebuilds show up without a restart
+            # (and a partial build without index.html still starts up)
+            async def serve_index(request):
+                return FileResponse(index_file)
+
+        else:
+            index_bytes = index_file.read_bytes()
+
+            async def serve_index(request):
+                return Response(
+                    index_bytes,
+                    media_type="text/html",
+                    headers={"cache-control": "no-cache"},
+                )
 
-        routes.append(Route("/{path:path}", serve_index))
         routes.append(Route("/", serve_index))
 
+        # Other top-level files (must be last so the API wins)
+        routes.append(
+            Mount(
+                "/",
+                app=StaticFiles(directory=str(frontend_dist), html=True),
+                name="spa",
+            )
+        )
+
     app = Starlette(
         routes=routes,
         debug=dev_mode,
     )
 
-    # Add CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # CORS is only needed when the Vite dev server serves the frontend from
+    # another origin; in production the UI and API share one origin
+    if dev_mode:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     return app
@@ -11,7 +11,8 @@ function App() {
   const { sessions, loading: sessionsLoading, deleteSession, toggleFavorite } = useSessions(100);
   const [selectedSession, setSelectedSession] = useState<Session | null>(null);
   const { data: sessionData, loading: sessionLoading, error: sessionError } = useSession(
-    selectedSession?.id || null
+    selectedSession?.id || null,
+    selectedSession?.projectDir
   );
 
   // Auto-select first session when loaded
@@ -3,6 +3,15 @@ import type { Session, SessionData } from '../types';
 
 const API_BASE = '/api';
 
+/**
+ * Build a session API URL, passing the project folder when known so the
+ * server can skip searching for the session file
+ */
+function sessionUrl(id: string, projectDir?: string | null, suffix: string = '') {
+  const url = `${API_BASE}/sessions/${encodeURIComponent(id)}${suffix}`;
+  return projectDir ? `${url}?project=${encodeURIComponent(projectDir)}` : url;
+}
+
 /**
  * Fetch list of sessions
  */
@@ -31,7 +40,8 @@ export function useSessions(limit: number = 50) {
 
   const deleteSession = useCallback(async (sessionId: string) => {
     try {
-      const res = await fetch(`${API_BASE}/sessions/${encodeURIComponent(sessionId)}`, {
+      const projectDir = sessions.find(s => s.id === sessionId)?.projectDir;
+      const res = await fetch(sessionUrl(sessionId, projectDir), {
         method: 'DELETE',
       });
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
@@ -42,11 +52,12 @@ export function useSessions(limit: number = 50) {
       console.error('Failed to delete session:', err);
       return false;
     }
-  }, []);
+  }, [sessions]);
 
   const toggleFavorite = useCallback(async (sessionId: string) => {
     try {
-      const res = await fetch(`${API_BASE}/sessions/${encodeURIComponent(sessionId)}/favorite`, {
+      const projectDir = sessions.find(s => s.id === sessionId)?.projectDir;
+      const res = await fetch(sessionUrl(sessionId, projectDir, '/favorite'), {
         method: 'POST',
       });
       if (!res.ok) throw new Error(`HTTP ${res.status}`);
@@ -62,7 +73,7 @@ export function useSessions(limit: number = 50) {
       console.error('Failed to toggle favorite:', err);
       return null;
     }
-  }, []);
+  }, [sessions]);
 
   return { sessions, loading, error, deleteSession, toggleFavorite, refreshSessions };
 }
@@ -70,7 +81,7 @@ export function useSessions(limit: number = 50) {
 /**
  * Fetch single session data
  */
-export function useSession(id: string | null) {
+export function useSession(id: string | null, projectDir?: string | null) {
   const [data, setData] = useState<SessionData | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -85,7 +96,7 @@ export function useSession(id: string | null) {
       try {
         setLoading(true);
         setError(null);
-        const res = await fetch(`${API_BASE}/sessions/${encodeURIComponent(String(id))}`);
+        const res = await fetch(sessionUrl(String(id), projectDir));
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
         const jsonData = await res.json();
         setData(jsonData);
@@ -96,7 +107,7 @@ export function useSession(id: string | null) {
       }
     }
     fetchSession();
-  }, [id]);
+  }, [id, projectDir]);
 
   return { data, loading, error };
 }
@@ -104,7 +115,7 @@ export function useSession(id: string | null) {
 /**
  * Fetch session as rendered HTML
  */
-export function useSessionHtml(id: string | null) {
+export function useSessionHtml(id: string | null, projectDir?: string | null) {
   const [html, setHtml] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -119,7 +130,7 @@ export function useSessionHtml(id: string | null) {
       try {
         setLoading(true);
         setError(null);
-        const res = await fetch(`${API_BASE}/sessions/${encodeURIComponent(String(id))}/html`);
+        const res = await fetch(sessionUrl(String(id), projectDir, '/html'));
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
         const htmlData = await res.text();
         setHtml(htmlData);
@@ -130,7 +141,7 @@ export function useSessionHtml(id: string | null) {
       }
     }
     fetchHtml();
-  }, [id]);
+  }, [id, projectDir]);
 
   return { html, loading, error };
 }
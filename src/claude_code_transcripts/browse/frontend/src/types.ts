@@ -8,6 +8,7 @@ export interface Session {
   mtime: number;
   size: number;
   project: string;
+  projectDir: string;
   filePath: string;
   isFavorite?: boolean;
 }
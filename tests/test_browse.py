@@ -0,0 +1,382 @@
+"""Tests for the session browser API."""
+
+import json
+import sys
+
+import pytest
+from starlette.testclient import TestClient
+
+from claude_code_transcripts import browse
+from claude_code_transcripts.browse import api
+from claude_code_transcripts.browse.api import _find_session_file, create_app
+
+
+@pytest.fixture
+def projects_dir(tmp_path, monkeypatch):
+    """Point the browser at a temporary ~/.claude/projects with one session."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(api, "_FAVORITES_FILE", tmp_path / ".claude" / "favorites.json")
+
+    projects = tmp_path / ".claude" / "projects"
+    project = projects / "-home-user-projects-myproject"
+    project.mkdir(parents=True)
+    (project / "abc123.jsonl").write_text(
+        '{"type": "user", "timestamp": "2025-01-01T10:00:00.000Z", "message": {"role": "user", "content": "Hello <b>there</b>"}}\n'
+        '{"type": "assistant", "timestamp": "2025-01-01T10:00:05.000Z", "message": {"role": "assistant", "content": [{"type": "text", "text": "Hi!"}]}}\n'
+    )
+    return projects
+
+
+@pytest.fixture
+def client(projects_dir):
+    return TestClient(create_app())
+
+
+class TestFindSessionFile:
+    def test_finds_session(self, projects_dir):
+        expected = projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        assert _find_session_file("abc123") == expected
+
+    def test_finds_session_in_given_project(self, projects_dir, monkeypatch):
+        monkeypatch.setattr(api, "_build_session_index", None)
+        expected = projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        found = _find_session_file("abc123", "-home-user-projects-myproject")
+        assert found == expected
+
+    def test_wrong_project_falls_back_to_search(self, projects_dir):
+        expected = projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        assert _find_session_file("abc123", "-other-project") == expected
+
+    def test_project_cannot_escape_projects_folder(self, projects_dir):
+        outside = projects_dir.parent / "abc999.jsonl"
+        outside.write_text("{}\n")
+        assert _find_session_file("abc999", "..") is None
+
+    def test_ignores_directory_symlink_loop(self, projects_dir):
+        project = projects_dir / "-home-user-projects-myproject"
+        (project / "loop").symlink_to(project)
+        assert _find_session_file("abc123") == project / "abc123.jsonl"
+        assert _find_session_file("nope") is None
+
+    def test_missing_session(self, projects_dir):
+        assert _find_session_file("nope") is None
+
+    def test_picks_up_new_session_in_existing_project(self, projects_dir):
+        assert _find_session_file("abc123") is not None
+        new_file = projects_dir / "-home-user-projects-myproject" / "new456.jsonl"
+        new_file.write_text("{}\n")
+        assert _find_session_file("new456") == new_file
+
+    def test_forgets_deleted_session(self, projects_dir):
+        session_file = projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        assert _find_session_file("abc123") == session_file
+        session_file.unlink()
+        assert _find_session_file("abc123") is None
+
+
+class TestSessionsApi:
+    def test_list_sessions(self, client):
+        response = client.get("/api/sessions")
+        assert response.status_code == 200
+        sessions = response.json()["sessions"]
+        assert [s["id"] for s in sessions] == ["abc123"]
+        assert sessions[0]["projectDir"] == "-home-user-projects-myproject"
+        assert sessions[0]["isFavorite"] is False
+
+    def test_list_sessions_reuses_walk_stat(self, client, monkeypatch):
+        original = api.Path.stat
+
+        def no_session_stat(self, *args, **kwargs):
+            if self.suffix == ".jsonl":
+                raise AssertionError("session file stat'ed again")
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(api.Path, "stat", no_session_stat)
+        response = client.get("/api/sessions")
+        assert [s["id"] for s in response.json()["sessions"]] == ["abc123"]
+
+    def test_session_detail(self, client):
+        response = client.get("/api/sessions/abc123")
+        assert response.status_code == 200
+        assert len(response.json()["loglines"]) == 2
+
+    def test_session_detail_is_cached(self, client, monkeypatch):
+        assert client.get("/api/sessions/abc123").status_code == 200
+
+        def fail(filepath):
+            raise AssertionError("session re-parsed")
+
+        monkeypatch.setattr(api, "parse_session_file", fail)
+        response = client.get("/api/sessions/abc123")
+        assert len(response.json()["loglines"]) == 2
+
+    def test_session_detail_reparses_modified_file(self, client, projects_dir):
+        assert len(client.get("/api/sessions/abc123").json()["loglines"]) == 2
+        session_file = projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        with session_file.open("a") as f:
+            f.write(
+                '{"type": "user", "timestamp": "2025-01-01T10:01:00.000Z", "message": {"role": "user", "content": "More"}}\n'
+            )
+        assert len(client.get("/api/sessions/abc123").json()["loglines"]) == 3
+
+    def test_session_detail_with_project(self, client):
+        response = client.get(
+            "/api/sessions/abc123?project=-home-user-projects-myproject"
+        )
+        assert response.status_code == 200
+
+    def test_session_not_found(self, client):
+        response = client.get("/api/sessions/nope")
+        assert response.status_code == 404
+
+    def test_toggle_favorite(self, client):
+        response = client.post("/api/sessions/abc123/favorite")
+        assert response.json() == {"isFavorite": True}
+        sessions = client.get("/api/sessions").json()["sessions"]
+        assert sessions[0]["isFavorite"] is True
+        response = client.post("/api/sessions/abc123/favorite")
+        assert response.json() == {"isFavorite": False}
+
+    def test_delete_session(self, client, projects_dir):
+        response = client.delete("/api/sessions/abc123")
+        assert response.json() == {"success": True}
+        assert not (
+            projects_dir / "-home-user-projects-myproject" / "abc123.jsonl"
+        ).exists()
+        assert client.get("/api/sessions/abc123").status_code == 404
+
+
+class TestFavorites:
+    def test_load_favorites_is_cached(self, projects_dir, monkeypatch):
+        api._FAVORITES_FILE.write_text('{"favorites": ["abc123"]}')
+        assert api._load_favorites() == {"abc123"}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("favorites file re-read")
+
+        monkeypatch.setattr(api.Path, "read_text", fail)
+        assert api._load_favorites() == {"abc123"}
+
+    def test_load_favorites_sees_external_changes(self, projects_dir):
+        api._FAVORITES_FILE.write_text('{"favorites": ["abc123"]}')
+        assert api._load_favorites() == {"abc123"}
+        api._FAVORITES_FILE.write_text('{"favorites": ["abc123", "def456"]}')
+        assert api._load_favorites() == {"abc123", "def456"}
+
+    def test_save_favorites_replaces_file(self, projects_dir):
+        api._save_favorites({"def456", "abc123"})
+        assert json.loads(api._FAVORITES_FILE.read_text()) == {
+            "favorites": ["abc123", "def456"]
+        }
+        assert not api._FAVORITES_FILE.with_name("favorites.json.tmp").exists()
+        assert api._load_favorites() == {"abc123", "def456"}
+
+
+class TestSessionHtml:
+    def test_session_html(self, client):
+        response = client.get("/api/sessions/abc123/html")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.text.startswith("<html>")
+        assert "<div class='entry assistant'><pre>Hi!</pre></div>" in response.text
+        assert response.text.endswith("</body></html>")
+
+    def test_session_html_escapes_content(self, client):
+        response = client.get("/api/sessions/abc123/html")
+        assert "<b>" not in response.text
+        assert "Hello &lt;b&gt;there&lt;/b&gt;" in response.text
+
+    def test_session_html_tolerates_malformed_entries(self, client, projects_dir):
+        session_file = projects_dir / "-home-user-projects-myproject" / "bad789.jsonl"
+        session_file.write_text(
+            '{"type": "user", "timestamp": "2025-01-01T10:00:00.000Z", "message": null}\n'
+            '{"type": "user", "timestamp": "2025-01-01T10:00:01.000Z", "message": {"content": 42}}\n'
+            '{"type": "assistant", "timestamp": "2025-01-01T10:00:02.000Z", "message": {"content": [{"type": "text", "text": null}, "junk"]}}\n'
+            '{"type": "assistant", "timestamp": "2025-01-01T10:00:03.000Z", "message": {"content": "Still here"}}\n'
+        )
+        response = client.get("/api/sessions/bad789/html")
+        assert response.status_code == 200
+        assert "<pre>Still here</pre>" in response.text
+        assert response.text.endswith("</body></html>")
+
+    def test_session_html_is_streamed_in_batches(self):
+        loglines = [
+            {"type": "user", "message": {"content": "x" * 1000}} for _ in range(200)
+        ]
+        chunks = list(api._iter_session_html(loglines))
+        assert 1 < len(chunks) < 10
+        html = b"".join(chunks)
+        assert html.count(b"<div class='entry user'>") == 200
+        assert html.endswith(b"</body></html>")
+
+    def test_session_html_not_found(self, client):
+        response = client.get("/api/sessions/nope/html")
+        assert response.status_code == 404
+
+
+class TestImmutableStaticFiles:
+    @pytest.fixture
+    def assets_client(self, tmp_path):
+        from starlette.applications import Starlette
+        from starlette.routing import Mount
+
+        (tmp_path / "index-BxK3_a9Z.js").write_text("console.log(1)")
+        (tmp_path / "logo.svg").write_text("<svg></svg>")
+        app = Starlette(
+            routes=[Mount("/assets", app=api.ImmutableStaticFiles(directory=tmp_path))]
+        )
+        return TestClient(app)
+
+    def test_hashed_asset_is_immutable(self, assets_client):
+        response = assets_client.get("/assets/index-BxK3_a9Z.js")
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+
+    def test_unhashed_asset_is_revalidated(self, assets_client):
+        response = assets_client.get("/assets/logo.svg")
+        assert "cache-control" not in response.headers
+
+
+class TestCreateApp:
+    def test_no_cors_headers_in_production(self, projects_dir):
+        client = TestClient(create_app())
+        response = client.get(
+            "/api/sessions", headers={"Origin": "http://localhost:5173"}
+        )
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_cors_headers_in_dev_mode(self, projects_dir):
+        client = TestClient(create_app(dev_mode=True))
+        response = client.get(
+            "/api/sessions", headers={"Origin": "http://localhost:5173"}
+        )
+        assert "access-control-allow-origin" in response.headers
+
+
+class TestCheckAndBuildFrontend:
+    @pytest.fixture
+    def frontend_dir(self, tmp_path, monkeypatch):
+        frontend_dir = tmp_path / "frontend"
+        (frontend_dir / "src").mkdir(parents=True)
+        (frontend_dir / "node_modules").mkdir()
+        (frontend_dir / "bun.lock").write_text("lock v1")
+        monkeypatch.setattr(browse, "_FRONTEND_DIR", frontend_dir)
+        monkeypatch.setattr(browse.shutil, "which", lambda name: f"/usr/bin/{name}")
+        return frontend_dir
+
+    @pytest.fixture
+    def commands(self, monkeypatch):
+        commands = []
+
+        def fake_run(cmd, cwd):
+            assert cmd[0] == "/usr/bin/bun"
+            commands.append(cmd[1:])
+            return True
+
+        monkeypatch.setattr(browse, "_run_streaming", fake_run)
+        return commands
+
+    def test_install_writes_stamp(self, frontend_dir, commands):
+        assert browse.check_and_build_frontend()
+        assert commands == [["install"], ["run", "build"]]
+        stamp = (frontend_dir / ".install_stamp").read_text()
+        assert stamp == browse._lockfile_hash(frontend_dir, "bun")
+
+    def test_install_skipped_when_stamp_matches(self, frontend_dir, commands):
+        (frontend_dir / ".install_stamp").write_text(
+            browse._lockfile_hash(frontend_dir, "bun")
+        )
+        assert browse.check_and_build_frontend()
+        assert commands == [["run", "build"]]
+
+    def test_install_runs_when_lockfile_changes(self, frontend_dir, commands):
+        (frontend_dir / ".install_stamp").write_text(
+            browse._lockfile_hash(frontend_dir, "bun")
+        )
+        (frontend_dir / "bun.lock").write_text("lock v2")
+        assert browse.check_and_build_frontend()
+        assert commands == [["install"], ["run", "build"]]
+        stamp = (frontend_dir / ".install_stamp").read_text()
+        assert stamp == browse._lockfile_hash(frontend_dir, "bun")
+
+    def test_install_runs_without_node_modules(self, frontend_dir, commands):
+        (frontend_dir / ".install_stamp").write_text(
+            browse._lockfile_hash(frontend_dir, "bun")
+        )
+        (frontend_dir / "node_modules").rmdir()
+        assert browse.check_and_build_frontend()
+        assert commands == [["install"], ["run", "build"]]
+
+    def test_no_package_manager(self, frontend_dir, commands, monkeypatch):
+        monkeypatch.setattr(browse.shutil, "which", lambda name: None)
+        assert not browse.check_and_build_frontend()
+        assert commands == []
+
+
+class TestFrontendRoutes:
+    @pytest.fixture
+    def frontend_dist(self, tmp_path):
+        dist = tmp_path / "dist"
+        (dist / "assets").mkdir(parents=True)
+        (dist / "index.html").write_text("<html>app</html>")
+        (dist / "favicon.svg").write_text("<svg></svg>")
+        (dist / "assets" / "index-BxK3_a9Z.js").write_text("console.log(1)")
+        return dist
+
+    def test_index_served_from_memory(self, projects_dir, frontend_dist):
+        client = TestClient(create_app(frontend_dist=frontend_dist))
+        (frontend_dist / "index.html").write_text("<html>changed</html>")
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.text == "<html>app</html>"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_index_reread_in_dev_mode(self, projects_dir, frontend_dist):
+        client = TestClient(create_app(dev_mode=True, frontend_dist=frontend_dist))
+        (frontend_dist / "index.html").write_text("<html>changed</html>")
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.text == "<html>changed</html>"
+
+    def test_static_files_from_dist(self, projects_dir, frontend_dist):
+        client = TestClient(create_app(frontend_dist=frontend_dist))
+        assert client.get("/index.html").text == "<html>app</html>"
+        assert client.get("/favicon.svg").text == "<svg></svg>"
+        response = client.get("/assets/index-BxK3_a9Z.js")
+        assert response.headers["cache-control"] == (
+            "public, max-age=31536000, immutable"
+        )
+
+    def test_dist_without_index_html(self, projects_dir, frontend_dist):
+        (frontend_dist / "index.html").unlink()
+        client = TestClient(create_app(frontend_dist=frontend_dist))
+        assert client.get("/api/sessions").status_code == 200
+        (frontend_dist / "index.html").write_text("<html>rebuilt</html>")
+        assert client.get("/").text == "<html>rebuilt</html>"
+
+    def test_unknown_path_is_404(self, projects_dir, frontend_dist):
+        client = TestClient(create_app(frontend_dist=frontend_dist))
+        assert client.get("/no/such/page").status_code == 404
+
+    def test_api_wins_over_static_mount(self, projects_dir, frontend_dist):
+        client = TestClient(create_app(frontend_dist=frontend_dist))
+        response = client.get("/api/sessions")
+        assert [s["id"] for s in response.json()["sessions"]] == ["abc123"]
+
+
+class TestRunStreaming:
+    def test_missing_executable(self, tmp_path, capsys):
+        assert not browse._run_streaming([str(tmp_path / "no-such-pm")], tmp_path)
+        assert "Error running" in capsys.readouterr().out
+
+    def test_failing_command(self, tmp_path, capsys):
+        cmd = [sys.executable, "-c", "print('building'); raise SystemExit(3)"]
+        assert not browse._run_streaming(cmd, tmp_path)
+        out = capsys.readouterr().out
+        assert "building" in out
+        assert "exit code 3" in out
+
+    def test_successful_command(self, tmp_path):
+        assert browse._run_streaming([sys.executable, "-c", "print('ok')"], tmp_path)
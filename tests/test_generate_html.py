@@ -1215,6 +1215,65 @@ class TestFindLocalSessions:
         results = find_local_sessions(tmp_path / ".claude" / "projects", limit=3)
         assert len(results) == 3
 
+    def test_skips_unreadable_entries(self, tmp_path):
+        """Test that dangling symlinks do not break the listing."""
+        projects_dir = tmp_path / ".claude" / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+
+        session_file = projects_dir / "session-1.jsonl"
+        session_file.write_text(
+            '{"type":"summary","summary":"Real session"}\n{"type":"user","timestamp":"2025-01-01T00:00:00Z","message":{"role":"user","content":"test"}}\n'
+        )
+        (projects_dir / "dangling.jsonl").symlink_to(projects_dir / "missing.jsonl")
+
+        results = find_local_sessions(tmp_path / ".claude" / "projects", limit=10)
+        assert results == [(session_file, "Real session")]
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test that symlink loops and aliased folders are not walked."""
+        projects_root = tmp_path / ".claude" / "projects"
+        projects_dir = projects_root / "test-project"
+        projects_dir.mkdir(parents=True)
+
+        session_file = projects_dir / "session-1.jsonl"
+        session_file.write_text(
+            '{"type":"summary","summary":"Real session"}\n{"type":"user","timestamp":"2025-01-01T00:00:00Z","message":{"role":"user","content":"test"}}\n'
+        )
+        (projects_dir / "loop").symlink_to(projects_dir)
+        (projects_root / "alias-project").symlink_to(projects_dir)
+
+        results = find_local_sessions(projects_root, limit=10)
+        assert results == [(session_file, "Real session")]
+
+    def test_only_reads_summaries_until_limit(self, tmp_path, monkeypatch):
+        """Test that older sessions beyond the limit are not opened."""
+        import os
+        import claude_code_transcripts
+
+        projects_dir = tmp_path / ".claude" / "projects" / "test-project"
+        projects_dir.mkdir(parents=True)
+
+        for i in range(5):
+            f = projects_dir / f"session-{i}.jsonl"
+            f.write_text(
+                f'{{"type":"summary","summary":"Session {i}"}}\n{{"type":"user","timestamp":"2025-01-01T00:00:00Z","message":{{"role":"user","content":"test"}}}}\n'
+            )
+            os.utime(f, (1700000000 + i, 1700000000 + i))
+
+        read = []
+        original = claude_code_transcripts.get_session_summary
+
+        def tracking_summary(filepath, *args, **kwargs):
+            read.append(filepath.name)
+            return original(filepath, *args, **kwargs)
+
+        monkeypatch.setattr(
+            claude_code_transcripts, "get_session_summary", tracking_summary
+        )
+        results = find_local_sessions(tmp_path / ".claude" / "projects", limit=2)
+        assert [summary for _, summary in results] == ["Session 4", "Session 3"]
+        assert read == ["session-4.jsonl", "session-3.jsonl"]
+
 
 class TestLocalSessionCLI:
     """Tests for CLI behavior with local sessions."""